@@ -1,16 +1,18 @@
-import fastf1
-import gradio as gr
+import os
+import logging
+import threading
+import numpy as np
 import pandas as pd
 from PIL import Image
-from typing import Union
-from fastf1.core import Session
+from typing import TYPE_CHECKING, Union
 
 # Local modules
-from utils import parser_utils, track_utils
+from utils.cache_utils import TTLCache, ttl_cache
 from utils.constants import (
     AVAILABLE_SESSION_TYPES,
-    DRIVER_DETAILS,
-    CONSTRUCTOR_DETAILS,
+    SESSION_TYPE_ALIASES,
+    DRIVER_TABLE,
+    CONSTRUCTOR_TABLE,
     CURRENT_YEAR
 )
 
@@ -18,9 +20,127 @@ from utils.constants import (
 gp = Union[str, int]
 session_type = Union[str, int, None]
 
+if TYPE_CHECKING:
+    from fastf1.core import Session
+    from fastf1.events import Event
+
+logger = logging.getLogger(__name__)
+
+# fastf1 (and gradio/matplotlib through track_utils) are imported on first use,
+# so tools that only read local data don't pay for them
+_fastf1 = None
+_ergast = None
+# Tool threads and the prewarm thread may ask for them at the same time, so they are only initialized once
+_lazy_init_lock = threading.Lock()
+
+# On-disk cache for FastF1's HTTP requests and parsed data
+_FASTF1_CACHE_DIR = ".fastf1_cache"
+
+def _lazy_fastf1():
+    """Import fastf1 and enable its on-disk cache the first time it is needed"""
+    global _fastf1
+    if _fastf1 is None:
+        with _lazy_init_lock:
+            if _fastf1 is None:
+                import fastf1
+                os.makedirs(_FASTF1_CACHE_DIR, exist_ok=True)
+                fastf1.Cache.enable_cache(_FASTF1_CACHE_DIR)
+                _fastf1 = fastf1
+    return _fastf1
+
+def _lazy_ergast():
+    """Shared Ergast client (its requests go through the fastf1 cache enabled above)"""
+    global _ergast
+    if _ergast is None:
+        fastf1 = _lazy_fastf1() # Outside the lock, which it takes itself
+        with _lazy_init_lock:
+            if _ergast is None:
+                _ergast = fastf1.ergast.Ergast()
+    return _ergast
+
+# Past seasons never change, sessions of the current season may still be updated
+_LIVE_SESSION_TTL = 600
+
+def _session_ttl(year: int, *_) -> Union[int, None]:
+    return _LIVE_SESSION_TTL if year == CURRENT_YEAR else None
+
+# Ordinal suffixes indexed by the last digit of a position (1 -> "st", 2 -> "nd", ...)
+_ORDINAL_SUFFIXES = ("th", "st", "nd", "rd") + ("th",) * 6
+
+def _ordinal_suffix(position: int) -> str:
+    return "th" if 11 <= position % 100 <= 13 else _ORDINAL_SUFFIXES[position % 10]
+
+def _normalize(year: int, round: gp, session_type: session_type) -> tuple[int, gp, session_type]:
+    """Normalize tool arguments so equivalent requests share a cache entry (e.g. (2024.0, "5", "R") -> (2024, 5, "race"))"""
+    if isinstance(round, str) and round.isnumeric():
+        round = int(round)
+    if isinstance(session_type, str):
+        session_type = SESSION_TYPE_ALIASES.get(session_type.lower(), session_type)
+    return int(year), round, session_type
+
+### Cached session helpers ###
+
+@ttl_cache(maxsize=128, ttl=_session_ttl)
+def _cached_event(year: int, round: gp) -> "Event":
+    """Event of a round, read-only and shared between callers (unlike Session objects, which get loaded)"""
+    return _lazy_fastf1().get_session(year, round, "race").event # Event object is the same for all sessions, so hardcode "race"
+
+# (year, round, session_type) -> (loaded session, whether telemetry was loaded).
+# A session loaded with telemetry can take hundreds of MB, so only the two most recent are kept,
+# and past seasons expire too so an idle process releases them.
+_loaded_sessions = TTLCache(maxsize=2)
+_LOADED_PAST_SESSION_TTL = 1800
+
+# (year, round, session_type) -> lock held while that session is loaded. fastf1 is not thread-safe, and sessions
+# are shared between the Gradio worker threads and the prewarm thread, so the same session is never loaded twice at once.
+_session_locks: dict[tuple, threading.Lock] = {}
+_session_locks_guard = threading.Lock()
+
+def _session_lock(key: tuple) -> threading.Lock:
+    with _session_locks_guard:
+        return _session_locks.setdefault(key, threading.Lock())
+
+def _loaded_session(year: int, round: gp, session_type: session_type, telemetry: bool) -> "Session":
+    """Load a session once and share it between tools, reloading only to add telemetry"""
+    key = (year, round, session_type)
+    with _session_lock(key):
+        session, has_telemetry = _loaded_sessions.get(key, (None, False))
+        if session is None or (telemetry and not has_telemetry):
+            # Always load into a new Session object, a shared one may still be read by other threads
+            session = _lazy_fastf1().get_session(year, round, session_type)
+            session.load(telemetry=telemetry)
+            _loaded_sessions.set(key, (session, telemetry), ttl=_session_ttl(year) or _LOADED_PAST_SESSION_TTL)
+    return session
+
+def _format_lap_times(times: pd.Series) -> list[str]:
+    """Format a timedelta Series as mm:ss.mmm strings, with "-" for missing times"""
+    ns = times.to_numpy(dtype="timedelta64[ns]").view("i8")
+    missing = ns == np.iinfo(np.int64).min # NaT
+    minutes, rem = np.divmod(ns // 1_000_000, 60_000)
+    seconds, millis = np.divmod(rem, 1000)
+    return ["-" if na else f"{m:02d}:{s:02d}.{ms:03d}" for na, m, s, ms in zip(missing.tolist(), minutes.tolist(), seconds.tolist(), millis.tolist())]
+
+def _standings_by_name(names: pd.Series, standings: pd.DataFrame) -> dict[str, tuple[int, int, int]]:
+    """Map each name to its (position, points, wins), converted to ints once for the whole table"""
+    rows = standings[["position", "points", "wins"]].to_numpy(dtype=np.int64).tolist()
+    return dict(zip(names, map(tuple, rows)))
+
+@ttl_cache(maxsize=32, ttl=_session_ttl)
+def _driver_standings(year: int) -> dict[str, tuple[int, int, int]]:
+    """Driver standings of a season keyed by the driver's full name"""
+    standings = _lazy_ergast().get_driver_standings(year).content[0]
+    full_names = standings["givenName"].str.cat(standings["familyName"], sep=" ")
+    return _standings_by_name(full_names, standings)
+
+@ttl_cache(maxsize=32, ttl=_session_ttl)
+def _constructor_standings(year: int) -> dict[str, tuple[int, int, int]]:
+    """Constructor standings of a season keyed by the constructor name"""
+    standings = _lazy_ergast().get_constructor_standings(year).content[0]
+    return _standings_by_name(standings["constructorName"], standings)
+
 ### FastF1 tools ###
 
-def get_session(year: int, round: gp, session_type: session_type) -> Session:
+def get_session(year: int, round: gp, session_type: session_type) -> "Session":
     """Retrieve a specific Formula 1 session.
     
     Args:
@@ -37,14 +157,11 @@ def get_session(year: int, round: gp, session_type: session_type) -> Session:
     """
 
     # Check if session type is valid
-    if isinstance(session_type, str):
-        if session_type.lower() not in AVAILABLE_SESSION_TYPES:
-            return f"Session type {session_type} is not available. Supported session types: {AVAILABLE_SESSION_TYPES}"
-    
-    if isinstance(round, str) and round.isnumeric():
-        round = int(round)
+    if isinstance(session_type, str) and session_type.lower() not in AVAILABLE_SESSION_TYPES:
+        return f"Session type {session_type} is not available. Supported session types: {list(SESSION_TYPE_ALIASES)}"
 
-    return fastf1.get_session(year, round, session_type)
+    # Always a new Session: callers .load() it, and a shared Session must not be loaded by several threads
+    return _lazy_fastf1().get_session(*_normalize(year, round, session_type))
 
 def get_season_calendar(year: int) -> str:
     """Get the complete race calendar for a specific F1 season.
@@ -55,7 +172,9 @@ def get_season_calendar(year: int) -> str:
     Returns:
         str: Formatted string containing the season calendar
     """
-    season_calendar = fastf1.get_event_schedule(year)
+    from utils import parser_utils
+
+    season_calendar = _lazy_fastf1().get_event_schedule(year)
     return parser_utils.parse_season_calendar(season_calendar)
 
 def get_event_info(year: int, round: gp, format: str) -> str:
@@ -70,15 +189,13 @@ def get_event_info(year: int, round: gp, format: str) -> str:
         str: Formatted event information based on the specified format
     """
 
-    if isinstance(round, str) and round.isnumeric():
-        round = int(round)
-
-    event = fastf1.get_session(year, round, "race").event # Event object is the same for all sessions, so hardcode "race"
+    event = _cached_event(*_normalize(year, round, None)[:2])
     if format == "human":
         data_interval = f"{event['Session1DateUtc'].date()} - {event['Session5DateUtc'].date()}"
         event_string = f"Round {event['RoundNumber']} : {event['EventName']} - {event['Location']}, {event['Country']} ({data_interval})"
         return event_string
     elif format == "LLM":
+        from utils import parser_utils
         return parser_utils.parse_event_info(event)
 
 def driver_championship_standings(year: int, driver_name: str) -> str:
@@ -92,15 +209,12 @@ def driver_championship_standings(year: int, driver_name: str) -> str:
         str: Formatted string with driver's position, points, and wins
     """
 
-    ergast = fastf1.ergast.Ergast()
-    driver_standings = ergast.get_driver_standings(year).content[0]
-    driver_standing = driver_standings[["position", "points", "wins", "givenName", "familyName"]].reset_index(drop=True)
-    driver_standing = driver_standing[(driver_standing["givenName"] + " " + driver_standing["familyName"]) == driver_name]
-    if driver_standing.empty:
+    driver_standing = _driver_standings(year).get(driver_name)
+    if driver_standing is None:
         return f"Could not find stats for {driver_name}"
-    suffix = "st" if driver_standing['position'].iloc[0] == 1 else "nd" if driver_standing['position'].iloc[0] == 2 else "rd" if driver_standing['position'].iloc[0] == 3 else "th"
+    position, points, wins = driver_standing
     is_was = "is" if year == CURRENT_YEAR else "was"
-    standings_string = f"{driver_name} {is_was} {int(driver_standing['position'].iloc[0])}{suffix} with {int(driver_standing['points'].iloc[0])} points and {int(driver_standing['wins'].iloc[0])} wins"
+    standings_string = f"{driver_name} {is_was} {position}{_ordinal_suffix(position)} with {points} points and {wins} wins"
     return standings_string
     
 def constructor_championship_standings(year: int, constructor_name: str) -> str:
@@ -114,13 +228,12 @@ def constructor_championship_standings(year: int, constructor_name: str) -> str:
         str: Formatted string with constructor's position, points, and wins
     """
 
-    ergast = fastf1.ergast.Ergast()
-    constructor_standings = ergast.get_constructor_standings(year).content[0]
-    constructor_standing = constructor_standings[["position", "points", "wins", "constructorName"]].reset_index(drop=True)
-    constructor_standing = constructor_standing[constructor_standing["constructorName"] == constructor_name]
-    suffix = "st" if constructor_standing['position'].iloc[0] == 1 else "nd" if constructor_standing['position'].iloc[0] == 2 else "rd" if constructor_standing['position'].iloc[0] == 3 else "th"
+    constructor_standing = _constructor_standings(year).get(constructor_name)
+    if constructor_standing is None:
+        return f"Could not find stats for {constructor_name}"
+    position, points, wins = constructor_standing
     are_were = "are" if year == CURRENT_YEAR else "were"
-    standings_string = f"{constructor_name} {are_were} {int(constructor_standing['position'].iloc[0])}{suffix} with {int(constructor_standing['points'].iloc[0])} points and {int(constructor_standing['wins'].iloc[0])} wins"
+    standings_string = f"{constructor_name} {are_were} {position}{_ordinal_suffix(position)} with {points} points and {wins} wins"
     return standings_string
 
 def track_visualization(year: int, round: gp, visualization_type: str) -> Image.Image:
@@ -134,11 +247,9 @@ def track_visualization(year: int, round: gp, visualization_type: str) -> Image.
     Returns:
         Image.Image: A PIL Image object containing the visualization
     """
-    if isinstance(round, str) and round.isnumeric():
-        round = int(round)
+    from utils import track_utils
 
-    session = get_session(year, round, "race")
-    session.load()
+    session = _loaded_session(*_normalize(year, round, "race"), True)
 
     if visualization_type == "speed":
         return track_utils.create_track_speed_visualization(session)
@@ -161,20 +272,19 @@ def get_session_results(year: int, round: gp, session_type: session_type) -> pd.
     Raises:
         ValueError: If the session type is invalid
     """
-    if isinstance(round, str) and round.isnumeric():
-        round = int(round)
+    year, round, session_type = _normalize(year, round, session_type)
 
     try:
-        session = get_session(year, round, session_type)
-        session.load(telemetry=False)
+        session = _loaded_session(year, round, session_type, False)
         # Create a proper copy of the results DataFrame
         df = session.results[['DriverNumber', 'Abbreviation', 'FullName', 'Position', 
                             'GridPosition', 'Points', 'Status', 'Q1', 'Q2', 'Q3']].copy()
     except ValueError as e:
+        import gradio as gr
         raise gr.Error(f"Session type {session_type} is not supported for the specified round. This Grand Prix most likely did not include a sprint race/quali.")
 
     # Now we can safely modify the DataFrame
-    df["Name"] = df.apply(lambda row: f"{row['FullName']} ({row['Abbreviation']} • {row['DriverNumber']})", axis=1)
+    df["Name"] = df["FullName"].astype(str) + " (" + df["Abbreviation"].astype(str) + " • " + df["DriverNumber"].astype(str) + ")"
     df = df.drop(columns=["FullName", "Abbreviation", "DriverNumber"])
     df = df.rename(columns={"Position": "Pos", "GridPosition": "Grid Pos"})
 
@@ -182,7 +292,8 @@ def get_session_results(year: int, round: gp, session_type: session_type) -> pd.
     if session_type in ["race", "sprint"]:
         df = df[["Pos", "Name", "Points", "Grid Pos", "Status"]]
     elif "qualifying" in session_type:
-        df[["Q1", "Q2", "Q3"]] = df[["Q1", "Q2", "Q3"]].apply(lambda x: x.dt.total_seconds().apply(lambda y: f"{int(y//60):02d}:{int(y%60):02d}.{int(y%1*1000):03d}" if pd.notna(y) else "-"))
+        for col in ("Q1", "Q2", "Q3"):
+            df[col] = _format_lap_times(df[col])
         df = df[["Pos", "Name", "Q1", "Q2", "Q3"]]
     return df
 
@@ -196,8 +307,9 @@ def get_driver_info(driver_name: str) -> str:
         str: Formatted string with driver's details including name, team, number,
              nationality, and a brief summary
     """
-    driver = DRIVER_DETAILS[driver_name]
-    driver_info_string = f"{driver_name} ({driver['birth_date']}) {driver['nationality']}\n{driver['team']} #{driver['number']}\n\n{driver['summary']}"
+    drivers = DRIVER_TABLE
+    i = drivers.name_to_idx[driver_name]
+    driver_info_string = f"{driver_name} ({drivers.birth_dates[i]}) {drivers.nationalities[i]}\n{drivers.teams[i]} #{drivers.numbers[i]}\n\n{drivers.summaries[i]}"
     return driver_info_string
 
 def get_constructor_info(constructor_name: str) -> str:
@@ -210,10 +322,26 @@ def get_constructor_info(constructor_name: str) -> str:
         str: Formatted string with constructor's details including name, team, number,
              nationality, and a brief summary
     """
-    constructor = CONSTRUCTOR_DETAILS[constructor_name]
-    constructor_info_string = f"{constructor['team_name']} ({constructor_name})\n{constructor['base']}\nTeam principle: {constructor['team_principal']}\nDriver(s): {constructor['drivers'][0]} & {constructor['drivers'][1]}\nPower unit: {constructor['power_unit']}\nChassis: {constructor['chassis']}"
+    constructors = CONSTRUCTOR_TABLE
+    i = constructors.name_to_idx[constructor_name]
+    drivers = constructors.drivers[i]
+    constructor_info_string = f"{constructors.team_names[i]} ({constructor_name})\n{constructors.bases[i]}\nTeam principle: {constructors.team_principals[i]}\nDriver(s): {drivers[0]} & {drivers[1]}\nPower unit: {constructors.power_units[i]}\nChassis: {constructors.chassis[i]}"
     return constructor_info_string
     
+def prewarm_cache() -> None:
+    """Fetch the current season calendar and load the latest completed race into the caches.
+
+    Meant to run in a background thread at startup so the first user request doesn't pay for the cold load.
+    Errors (e.g. no network) are only logged at debug level, the tools will simply fetch the data on demand instead.
+    """
+    try:
+        schedule = _lazy_fastf1().get_event_schedule(CURRENT_YEAR, include_testing=False)
+        completed = schedule[schedule["Session5DateUtc"] < pd.Timestamp.now("UTC").tz_localize(None)]
+        if not completed.empty:
+            _loaded_session(*_normalize(CURRENT_YEAR, int(completed["RoundNumber"].iloc[-1]), "race"), False)
+    except Exception:
+        logger.debug("Prewarming the FastF1 caches failed", exc_info=True)
+    
 
 if __name__ == "__main__":
     session = get_session(2024, 1, "fp1")
@@ -1,4 +1,5 @@
 import os
+import inspect
 import datetime
 import gradio as gr
 import openf1_tools
@@ -56,8 +57,11 @@ if __name__ == "__main__":
 
         # Filter tools to only use the OpenF1 library
         if openf1_tool_only:
-            openf1_fn_names = [f"f1_mcp_server_{fn}" for fn in dir(openf1_tools) if callable(getattr(openf1_tools, fn))]
-            openf1_fn_names.remove("f1_mcp_server_urlopen")
+            # Only public functions defined in openf1_tools (skips imports like urlopen/quote and private helpers)
+            openf1_fn_names = {
+                f"f1_mcp_server_{name}" for name, fn in vars(openf1_tools).items()
+                if inspect.isfunction(fn) and fn.__module__ == openf1_tools.__name__ and not name.startswith("_")
+            }
             tools = [t for t in tools if (t.name in openf1_fn_names)]
             logger.info(f"Filtered tools to only OpenF1 tools: {len(tools)} remaining.")
 
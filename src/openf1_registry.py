@@ -1,8 +1,9 @@
 from enum import Enum
+from types import MappingProxyType
 from dataclasses import dataclass
-from typing import Dict, Set, List, Optional
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
 
-api_endpoints = {
+api_endpoints = MappingProxyType({
     "sessions": "sessions?",
     "weather": "weather?",
     "locations": "locations?",
@@ -15,7 +16,7 @@ api_endpoints = {
     "race_control": "race_control?",
     "stints": "stints?",
     "team_radio": "team_radio?",
-}
+})
 
 class FilterType(Enum):
     EQUALITY = "equality"       # exact match
@@ -27,58 +28,51 @@ class DataType(Enum):
     DATETIME = "datetime"
     BINARY = "binary"          # true/false filters
 
-@dataclass
+# (filter type, data type) -> example query suffixes appended to the filter name
+_EXAMPLE_SUFFIXES: Dict[Tuple[FilterType, DataType], Tuple[str, ...]] = {
+    (FilterType.EQUALITY, DataType.STRING): ("=example_value",),
+    (FilterType.EQUALITY, DataType.INTEGER): ("=42",),
+    (FilterType.EQUALITY, DataType.DATETIME): ("=2024-01-01T00:00:00Z", "=2024-01-01T10:30:00Z"),
+    (FilterType.COMPARISON, DataType.INTEGER): (">=10", "<100"),
+    (FilterType.COMPARISON, DataType.DATETIME): (">=2024-01-01T00:00:00Z", "<2024-12-31T00:00:00Z"),
+    (FilterType.COMPARISON, DataType.STRING): (">M", "<Z"),  # alphabetical comparison
+}
+
+@dataclass(frozen=True, slots=True)
 class FilterSpec:
     """Specification for an API filter parameter"""
     name: str
     filter_type: FilterType
     data_type: DataType
     description: str = ""
-    allowed_values: Optional[List[str]] = None  # For equality filters with restricted values
-    
+    allowed_values: Optional[Tuple[str, ...]] = None  # For equality filters with restricted values
+
     def get_query_examples(self) -> List[str]:
         """Generate example query parameters for this filter"""
-        examples = []
-        
         if self.data_type == DataType.BINARY:
-            examples = [f"{self.name}=true", f"{self.name}=false"]
-        
-        elif self.filter_type == FilterType.EQUALITY:
-            if self.allowed_values:
-                examples = [f"{self.name}={val}" for val in self.allowed_values[:2]]
-            elif self.data_type == DataType.STRING:
-                examples = [f"{self.name}=example_value"]
-            elif self.data_type == DataType.INTEGER:
-                examples = [f"{self.name}=42"]
-            elif self.data_type == DataType.DATETIME:
-                examples = [f"{self.name}=2024-01-01T00:00:00Z", f"{self.name}=2024-01-01T10:30:00Z"]
-        
-        elif self.filter_type == FilterType.COMPARISON:
-            if self.data_type == DataType.INTEGER:
-                examples = [f"{self.name}>=10", f"{self.name}<100"]
-            elif self.data_type == DataType.DATETIME:
-                examples = [f"{self.name}>=2024-01-01T00:00:00Z", f"{self.name}<2024-12-31T00:00:00Z"]
-            elif self.data_type == DataType.STRING:
-                examples = [f"{self.name}>M", f"{self.name}<Z"]  # alphabetical comparison
-        
-        return examples
+            return [f"{self.name}=true", f"{self.name}=false"]
+        if self.filter_type == FilterType.EQUALITY and self.allowed_values:
+            return [f"{self.name}={val}" for val in self.allowed_values[:2]]
+        return [self.name + suffix for suffix in _EXAMPLE_SUFFIXES.get((self.filter_type, self.data_type), ())]
     
     def help_text(self) -> str:
         """Generate help text for this filter"""
-        text = f"Filter: {self.name}\n"
-        text += f"  Type: {self.filter_type.value} ({self.data_type.value})\n"
+        parts = [
+            f"Filter: {self.name}\n",
+            f"  Type: {self.filter_type.value} ({self.data_type.value})\n",
+        ]
         
         if self.description:
-            text += f"  Description: {self.description}\n"
+            parts.append(f"  Description: {self.description}\n")
         
         if self.allowed_values:
-            text += f"  Allowed values: {', '.join(self.allowed_values)}\n"
+            parts.append(f"  Allowed values: {', '.join(self.allowed_values)}\n")
         
         examples = self.get_query_examples()
         if examples:
-            text += f"  Examples: {', '.join(examples)}"
+            parts.append(f"  Examples: {', '.join(examples)}")
         
-        return text
+        return "".join(parts)
 
 
 
@@ -87,8 +81,14 @@ class APIEndpointRegistry:
     
     def __init__(self, base_url: str = ""):
         self.base_url = base_url
-        self.endpoints: Dict[str, Set[str]] = {}  # endpoint -> filter names
-        self.filters: Dict[str, FilterSpec] = {}  # global filter definitions
+        self.endpoints: Mapping[str, FrozenSet[str]] = {}  # endpoint -> filter names
+        self.filters: Mapping[str, FilterSpec] = {}  # global filter definitions
+        self._endpoint_filters: Dict[str, Mapping[str, FilterSpec]] = {}  # endpoint -> read-only filter specs
+        # filter name -> precomputed help text. Kept here rather than on the specs, which are serialized in tool responses.
+        self._filter_help: Dict[str, str] = {}
+        self._endpoint_help: Dict[str, str] = {}  # endpoint -> precomputed help text
+        self._endpoints_sorted: Tuple[str, ...] = ()  # filled in by finalize()
+        self._filters_sorted: Tuple[str, ...] = ()
     
     def define_filter(
         self, 
@@ -99,61 +99,68 @@ class APIEndpointRegistry:
         allowed_values: Optional[List[str]] = None
     ) -> 'APIEndpointRegistry':
         """Define a filter that can be used by endpoints"""
+        allowed_values = tuple(str(value) for value in allowed_values) if allowed_values else None  # Help text joins these as strings
         filter_spec = FilterSpec(name, filter_type, data_type, description, allowed_values)
         self.filters[name] = filter_spec
+        self._filter_help[name] = filter_spec.help_text()
         return self
     
     def register_endpoint(self, endpoint: str, *filter_names: str) -> 'APIEndpointRegistry':
         """Register an API endpoint with its supported filters"""
 
         # Validate all filters exist
-        for filter_name in filter_names:
-            if filter_name not in self.filters:
-                raise ValueError(f"Filter '{filter_name}' not defined. Use define_filter() first.")
+        missing = set(filter_names).difference(self.filters)
+        if missing:
+            raise ValueError(f"Filters {sorted(missing)} not defined. Use define_filter() first.")
         
         # Store endpoint -> filters mapping
-        self.endpoints[endpoint] = set(filter_names)
+        self.endpoints[endpoint] = frozenset(filter_names)
+
+        # Endpoints are only registered at import, so build the filter specs and help text once here
+        self._endpoint_filters[endpoint] = MappingProxyType({name: self.filters[name] for name in filter_names})
+        self._endpoint_help[endpoint] = self._build_endpoint_help(endpoint)
         
         return self
-    
-
 
+    def _build_endpoint_help(self, endpoint: str) -> str:
+        """Build help text for all filters supported by an endpoint"""
 
+        filters = self._endpoint_filters[endpoint]
+        if not filters:
+            return f"Endpoint '{endpoint}' has no registered filters."
+        
+        header = f"API Endpoint: {self.base_url}{endpoint}\nSupported filters ({len(filters)}):\n\n"
+        body = "\n\n".join(self._filter_help[name] for name in sorted(filters))
+        return (header + body).strip()
+
+    def finalize(self) -> 'APIEndpointRegistry':
+        """Freeze the registry once all filters and endpoints are defined"""
+        self.filters = MappingProxyType(self.filters)
+        self.endpoints = MappingProxyType(self.endpoints)
+        self._endpoints_sorted = tuple(sorted(self.endpoints))
+        self._filters_sorted = tuple(sorted(self.filters))
+        return self
 
-    def get_endpoint_filters(self, endpoint: str) -> Dict[str, FilterSpec]:
+    def get_endpoint_filters(self, endpoint: str) -> Mapping[str, FilterSpec]:
         """Get all filters supported by an endpoint"""
-        filter_names = self.endpoints.get(endpoint, set())
-        return {name: self.filters[name] for name in filter_names}
+        return self._endpoint_filters.get(endpoint, MappingProxyType({}))
         
     def get_filter_help(self, filter_name: str) -> str:
         """Get help text for a specific filter"""
 
-        if filter_name in self.filters:
-            return self.filters[filter_name].help_text()
-        return f"Filter '{filter_name}' not found."
+        return self._filter_help.get(filter_name, f"Filter '{filter_name}' not found.")
     
     def get_endpoint_help(self, endpoint: str) -> str:
         """Get help text for all filters supported by an endpoint"""
-
-        filters = self.get_endpoint_filters(endpoint)
-        if not filters:
-            return f"Endpoint '{endpoint}' has no registered filters."
-        
-        help_text = f"API Endpoint: {self.base_url}{endpoint}\n"
-        help_text += f"Supported filters ({len(filters)}):\n\n"
-        
-        for name, spec in sorted(filters.items()):
-            help_text += spec.help_text() + "\n\n"
-        
-        return help_text.strip()
+        return self._endpoint_help.get(endpoint, f"Endpoint '{endpoint}' has no registered filters.")
     
     def list_all_endpoints(self) -> List[str]:
         """Get list of all registered endpoints"""
-        return sorted(self.endpoints.keys())
+        return list(self._endpoints_sorted)
     
     def list_all_filters(self) -> List[str]:
         """Get list of all defined filters"""
-        return sorted(self.filters.keys())
+        return list(self._filters_sorted)
 
 
 # Create registry with base URL
@@ -187,7 +194,7 @@ f1_api.define_filter("meeting_name", FilterType.EQUALITY, DataType.STRING, "The
 f1_api.define_filter("meeting_official_name", FilterType.EQUALITY, DataType.STRING, "The official name of the meeting.")
 f1_api.define_filter("year", FilterType.EQUALITY, DataType.INTEGER, "The year of the event.")
 f1_api.define_filter("pit_duration", FilterType.COMPARISON, DataType.INTEGER, "The time spent in the pit, from entering to leaving the pit lane, in seconds.")
-f1_api.define_filter("position", FilterType.EQUALITY, DataType.INTEGER, "Position of the driver (starts at 1).", [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20])
+f1_api.define_filter("position", FilterType.EQUALITY, DataType.INTEGER, "Position of the driver (starts at 1).", [str(i) for i in range(1, 21)])
 f1_api.define_filter("category", FilterType.EQUALITY, DataType.STRING, "The category of the event (CarEvent, Drs, Flag, SafetyCar)", ["CarEvent", "Drs", "Flag", "SafetyCar"])
 f1_api.define_filter("flag", FilterType.EQUALITY, DataType.STRING, "The flag displayed to the drivers.", ["Green", "Yellow", "Red", "Black", "White", "Blue", "Checkered", "White"])
 f1_api.define_filter("message", FilterType.EQUALITY, DataType.STRING, "Description of the event or action.")
@@ -220,4 +227,7 @@ f1_api.register_endpoint("race_control", "category", "date", "driver_number", "m
 f1_api.register_endpoint("sessions", "circuit_key", "circuit_short_name", "country_code", "country_key", "country_name", "date_start", "date_end", "location", "session_name", "session_type", "session_key", "meeting_key", "year")
 f1_api.register_endpoint("stints", "compound", "driver_number", "lap_end", "lap_start", "meeting_key", "session_key", "stint_number", "tyre_age_at_start")
 f1_api.register_endpoint("team_radio", "date", "driver_number", "meeting_key", "session_key")
-f1_api.register_endpoint("weather", "air_temperature", "date", "humidity", "pressure", "rainfall", "track_temperature", "wind_direction", "wind_speed", "meeting_key", "session_key")
\ No newline at end of file
+f1_api.register_endpoint("weather", "air_temperature", "date", "humidity", "pressure", "rainfall", "track_temperature", "wind_direction", "wind_speed", "meeting_key", "session_key")
+
+# The registry is read-only from here on
+f1_api.finalize()
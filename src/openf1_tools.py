@@ -1,6 +1,47 @@
-import json
-from urllib.request import urlopen
+import re
+import datetime
+import requests
+from typing import Iterable, Tuple
+from urllib.parse import quote
+from requests.adapters import HTTPAdapter
 from openf1_registry import f1_api, api_endpoints
+from utils.cache_utils import TTLCache
+
+try:
+    from orjson import loads as _json_loads # Parses the raw response bytes directly, several times faster than json
+except ImportError:
+    from json import loads as _json_loads
+
+# Endpoints are registered once at import, so the sorted listing never changes
+_AVAILABLE_ENDPOINTS = f1_api.list_all_endpoints()
+
+# Shared HTTP session so repeated OpenF1 requests reuse keep-alive connections.
+# requests advertises Accept-Encoding (gzip/deflate, plus br when brotli is installed) and
+# transparently decompresses, so large endpoints like car_data are transferred compressed.
+_session = requests.Session()
+_session.headers.update({"User-Agent": "f1-mcp-server/0.1"})
+_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
+# Raw response bodies keyed by the full API string. Past sessions never change, while 'latest' data is live.
+# Bodies are stored as bytes and parsed on every call, so callers never share (and can't mutate) a cached object.
+# Both caches are also bounded by the total size of the bodies, since a single car_data/location response can be tens of MB.
+_response_cache = TTLCache(maxsize=512, ttl=300, maxweight=128 * 2**20, weigh=len)
+# ETag and raw body of the last 200 response per API string, used to revalidate expired entries
+_etag_cache = TTLCache(maxsize=512, ttl=24 * 3600, maxweight=128 * 2**20, weigh=lambda validated: len(validated[1]))
+_LATEST_TTL = 30
+_HISTORICAL_TTL = 3600
+_FIXED_KEY_PATTERN = re.compile(r"(?:session_key|meeting_key)=\d+")
+_YEAR_PATTERN = re.compile(r"year=(\d{4})")
+
+
+def _response_ttl(api_string: str) -> int | None:
+    """Pick how long a response may be served from cache (None means the cache default)."""
+    if "latest" in api_string:
+        return _LATEST_TTL
+    year = _YEAR_PATTERN.search(api_string)
+    if _FIXED_KEY_PATTERN.search(api_string) or (year and int(year.group(1)) < datetime.date.today().year):
+        return _HISTORICAL_TTL
+    return None
 
 ### Essential tools ###
 
@@ -17,19 +58,37 @@ def get_api_endpoint(endpoint: str) -> dict:
             - api_string (str): The full API URL for the endpoint
             - filter_metadata (dict): Available filters for the endpoint
     """
-    try:
-        url = f1_api.base_url + api_endpoints.get(endpoint, None)
-        return {
-            "status": "success",
-            "api_string": url,
-            "filter_metadata": f1_api.get_endpoint_filters(endpoint)
-        }
-    except:
+    if not isinstance(endpoint, str) or endpoint not in api_endpoints:
         return {
             "status": "error",
-            "api_string": f"Endpoint {endpoint} not found. Available endpoints: {f1_api.list_all_endpoints()}",
+            "api_string": f"Endpoint {endpoint} not found. Available endpoints: {_AVAILABLE_ENDPOINTS}",
             "filter_metadata": dict()
         }
+    return {
+        "status": "success",
+        "api_string": f1_api.base_url + api_endpoints[endpoint],
+        "filter_metadata": dict(f1_api.get_endpoint_filters(endpoint))
+    }
+
+
+def _format_filter(filter_name: str, operator: str, filter_value: str) -> str:
+    """URL-encode the filter value and combine it with the filter name and operator."""
+    return f"{filter_name}{operator}{quote(str(filter_value), safe='')}"
+
+
+def build_api_url(endpoint: str, filters: Iterable[Tuple[str, str, str]] = ()) -> str:
+    """
+    Build a complete OpenF1 API URL for an endpoint in a single pass.
+
+    Args:
+        endpoint (str): The name of the OpenF1 API endpoint (e.g., 'sessions', 'laps').
+        filters (Iterable[tuple[str, str, str]]): (filter_name, operator, filter_value) tuples.
+
+    Returns:
+        str: The complete API URL with all filter values URL-encoded.
+    """
+    query = "&".join(_format_filter(name, operator, value) for name, operator, value in filters)
+    return f1_api.base_url + api_endpoints[endpoint] + query
 
 
 def get_filter_string(filter_name: str, filter_value: str, operator: str = "=") -> str:
@@ -42,9 +101,9 @@ def get_filter_string(filter_name: str, filter_value: str, operator: str = "=")
         operator (str, optional): The comparison operator. Defaults to "=".
 
     Returns:
-        str: Formatted filter string that can be appended to an API request.
+        str: Formatted filter string (with URL-encoded value) that can be passed to apply_filters.
     """
-    return f"{filter_name}{operator}{filter_value}&"
+    return _format_filter(filter_name, operator, filter_value)
 
 
 def apply_filters(api_string: str, *filters: str) -> str:
@@ -53,15 +112,20 @@ def apply_filters(api_string: str, *filters: str) -> str:
 
     Args:
         api_string (str): The base API endpoint URL.
-        *filters (str): Variable number of filter strings to apply.
+        *filters (str): Variable number of filter strings to apply. A single string may hold several
+            comma-separated filters (filter values from get_filter_string encode commas as %2C).
 
     Returns:
         str: The complete API URL with all filters applied.
     """
-    if filters:
-        for filter in filters:
-            api_string += filter
-    return api_string.rstrip("&") # Remove trailing & for last filter
+    # Older filter strings carry a trailing &, and the UI passes all filters as one comma-separated string
+    parts = (part.strip().strip("&") for filter in filters for part in filter.split(","))
+    query = "&".join(part for part in parts if part)
+    if not query:
+        return api_string
+    if api_string.endswith(("?", "&")):
+        return api_string + query
+    return api_string + ("&" if "?" in api_string else "?") + query
 
 
 def send_request(api_string: str) -> dict:
@@ -72,18 +136,41 @@ def send_request(api_string: str) -> dict:
         api_string (str): The complete API URL to send the request to.
 
     Returns:
-        dict: The JSON response parsed as a Python dictionary.
+        dict: The JSON response parsed as a Python dictionary. Every call returns a newly parsed
+            object (also for cached responses), so it is safe to modify.
 
     Raises:
-        Exception: If there's an error during the HTTP request or JSON parsing.
+        requests.RequestException: If the HTTP request fails or returns an error status.
+        ValueError: If the response body is not valid JSON.
     """
-    try: 
-        response = urlopen(api_string)
-        data = json.loads(response.read().decode('utf-8'))
-        return data
-    except Exception as e:
-        print(f"Error: {e}")
-        raise
+    body = _response_cache.get(api_string)
+    if body is not None:
+        return _json_loads(body)
+
+    # Conditional request: a 304 reply has an empty body, so the previously received body is reused
+    validated = _etag_cache.get(api_string)
+    headers = {"If-None-Match": validated[0]} if validated is not None else None
+    response = _session.get(api_string, headers=headers, timeout=10)
+    if response.status_code == 304 and validated is not None:
+        body = validated[1]
+        data = _json_loads(body)
+    else:
+        response.raise_for_status()
+        body = response.content
+        data = _json_loads(body) # Parsed before caching, so invalid JSON is never cached
+        etag = response.headers.get("ETag")
+        if etag:
+            _etag_cache.set(api_string, (etag, body))
+
+    _response_cache.set(api_string, body, ttl=_response_ttl(api_string))
+    return data
+
+
+def _clear_response_caches() -> None:
+    _response_cache.clear()
+    _etag_cache.clear()
+
+send_request.cache_clear = _clear_response_caches # Allows tests/callers to drop cached responses
 
 ### LLM helper functions ###
 
@@ -115,7 +202,7 @@ def get_endpoint_info(endpoint: str) -> dict:
     """
     return {
         "endpoint": endpoint,
-        "endpoint_filters": f1_api.get_endpoint_filters(endpoint),
+        "endpoint_filters": dict(f1_api.get_endpoint_filters(endpoint)),
         "endpoint_help": f1_api.get_endpoint_help(endpoint)
     }
 
@@ -136,4 +223,32 @@ def get_filter_info(filter_name: str) -> dict:
     return {
         "filter_name": filter_name,
         "filter_metadata": f1_api.get_filter_help(filter_name)
-    }
\ No newline at end of file
+    }
+
+def get_all_endpoint_info() -> dict:
+    """
+    Retrieve detailed information about every OpenF1 API endpoint in a single call.
+
+    Returns:
+        dict: A dictionary mapping each endpoint name to a dictionary containing:
+            - endpoint_filters (list): Names of the filters available for this endpoint
+            - endpoint_help (str): Help text describing the endpoint's filters and usage
+    """
+    return {
+        endpoint: {
+            "endpoint_filters": sorted(f1_api.get_endpoint_filters(endpoint)),
+            "endpoint_help": f1_api.get_endpoint_help(endpoint)
+        }
+        for endpoint in f1_api.list_all_endpoints()
+    }
+
+
+def get_all_filter_info() -> dict:
+    """
+    Retrieve detailed information about every OpenF1 API filter in a single call.
+
+    Returns:
+        dict: A dictionary mapping each filter name to its help text, including
+              description, valid values, and usage examples
+    """
+    return {filter_name: f1_api.get_filter_help(filter_name) for filter_name in f1_api.list_all_filters()}
@@ -0,0 +1,92 @@
+import time
+import functools
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Union
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe LRU cache where every entry can carry its own time-to-live"""
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        ttl: Optional[float] = None,
+        maxweight: Optional[int] = None,
+        weigh: Optional[Callable[[Any], int]] = None
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl  # default time-to-live in seconds, None means entries never expire
+        self.maxweight = maxweight  # optional bound on the summed weight of all values (e.g. bytes), None means unbounded
+        self._weigh = weigh if weigh is not None else (lambda value: 0)
+        self._weight = 0
+        self._data: OrderedDict[Hashable, tuple[Optional[float], Any, int]] = OrderedDict()  # key -> (expires_at, value, weight)
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a cached value, or default if it is missing or has expired"""
+        with self._lock:
+            expires_at, value, weight = self._data.get(key, (None, _MISSING, 0))
+            if value is _MISSING:
+                return default
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                self._weight -= weight
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, using the cache's default ttl unless one is given.
+
+        Values heavier than maxweight on their own are not stored.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        weight = self._weigh(value)
+        with self._lock:
+            _, _, old_weight = self._data.pop(key, (None, None, 0))
+            self._weight -= old_weight
+            if self.maxweight is not None and weight > self.maxweight:
+                return
+            self._data[key] = (expires_at, value, weight)
+            self._weight += weight
+            while len(self._data) > self.maxsize or (self.maxweight is not None and self._weight > self.maxweight):
+                _, (_, _, evicted_weight) = self._data.popitem(last=False)
+                self._weight -= evicted_weight
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
+            self._weight = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+def ttl_cache(maxsize: int = 128, ttl: Union[float, Callable[..., Optional[float]], None] = None):
+    """Memoize a function on its positional arguments.
+
+    Args:
+        maxsize (int): Maximum number of cached results (least recently used are evicted first)
+        ttl (float | Callable | None): Time-to-live in seconds, or a callable that receives the
+            function arguments and returns one. None means results never expire.
+    """
+    def decorator(fn):
+        cache = TTLCache(maxsize=maxsize)
+
+        @functools.wraps(fn)
+        def wrapper(*args):
+            value = cache.get(args, _MISSING)
+            if value is _MISSING:
+                value = fn(*args)
+                cache.set(args, value, ttl=ttl(*args) if callable(ttl) else ttl)
+            return value
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
@@ -1,40 +1,193 @@
+import os
+import sys
+import gzip
 import json
+import mmap
+import pickle
+import hashlib
 import datetime
+import tempfile
+import functools
+
+from types import MappingProxyType
+from typing import Iterable, Mapping, NamedTuple
+
+try:
+    from orjson import loads as _orjson_loads # Parses bytes (and memoryviews) directly, several times faster than json
+except ImportError:
+    _orjson_loads = None
+
+__all__ = [
+    "IMAGE_BASE64", "CURRENT_YEAR", "SESSION_TYPE_ALIASES", "AVAILABLE_SESSION_TYPES", "DROPDOWN_SESSION_TYPES",
+    "DRIVER_NAMES", "CONSTRUCTOR_NAMES", "DRIVER_DETAILS", "CONSTRUCTOR_DETAILS",
+    "DriverTable", "ConstructorTable", "DRIVER_TABLE", "CONSTRUCTOR_TABLE",
+    "CONSTRUCTORS_PER_SEASON", "DRIVERS_PER_SEASON", "OPENF1_TOOL_DESCRIPTION",
+    "MARKDOWN_OPENF1_EXAMPLES", "MARKDOWN_INTRODUCTION", "HTML_INTRODUCTION",
+    "get_markdown_introduction", "get_html_introduction",
+    "preload_constants"
+]
+
+# Assets are resolved relative to this file (src/assets), not the current working directory
+_ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+
+@functools.lru_cache(maxsize=1)
+def _asset_entries() -> dict[str, os.DirEntry]:
+    """File name -> directory entry of every asset, listed with a single scandir call"""
+    with os.scandir(_ASSETS_DIR) as entries:
+        return {entry.name: entry for entry in entries}
+
+def _asset_entry(name: str) -> os.DirEntry:
+    """The gzip-compressed copy of a JSON asset (name + ".gz") if one is shipped, else the plain file"""
+    entries = _asset_entries()
+    entry = entries.get(name + ".gz") or entries.get(name)
+    if entry is None:
+        raise FileNotFoundError(os.path.join(_ASSETS_DIR, name))
+    return entry
+
+def _parse_json(name: str):
+    path = _asset_entry(name).path
+    if path.endswith(".gz"):
+        # Fewer bytes to read from disk, decompressed in memory
+        with gzip.open(path, "rb") as f:
+            data = f.read()
+        return json.loads(data) if _orjson_loads is None else _orjson_loads(data)
+    with open(path, "rb") as f:
+        if _orjson_loads is None:
+            return json.loads(f.read())
+        # Parse straight from the memory-mapped file, without copying it into a bytes object first
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return _orjson_loads(view)
+
+# The small JSON assets are also kept pre-parsed in a single pickle, which loads much faster than parsing JSON.
+# It lives in the user cache dir rather than the source tree, one file per assets directory.
+# Bump the version whenever the cached format changes, so old caches are rebuilt.
+_ASSET_CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "f1-mcp-server")
+_ASSET_CACHE_PATH = os.path.join(_ASSET_CACHE_DIR, f"assets-{hashlib.sha1(_ASSETS_DIR.encode()).hexdigest()[:12]}.pkl")
+_ASSET_CACHE_VERSION = 6
+_CACHED_ASSETS = (
+    "driver_names.json",
+    "constructors.json",
+    "driver_details.json",
+    "constructor_details.json",
+    "constructors_per_season.json",
+    "drivers_per_season.json",
+)
+
+def _interned(names: Iterable[str]) -> list[str]:
+    return [sys.intern(name) for name in names]
+
+def _per_season(per_season: dict) -> dict[int, list[str]]:
+    """Season keys as ints (JSON keys are always strings) and a single interned str object per name across all seasons.
+
+    Applied once, when the lazy constant is built. The pickle cache keeps the JSON's string keys.
+    """
+    return {int(season): _interned(season_names) for season, season_names in per_season.items()}
+
+def _dedupe_per_season(per_season: dict[str, list[str]]) -> dict[str, list[str]]:
+    """Share one str object per name across all seasons, so pickle's memo writes each name only once"""
+    names = {}
+    return {season: [names.setdefault(name, name) for name in season_names] for season, season_names in per_season.items()}
+
+@functools.lru_cache(maxsize=None)
+def _asset_cache() -> dict:
+    """Parsed small assets (name -> data), from the pickle cache unless it is missing or older than the JSON (or .json.gz) files"""
+    try:
+        # The asset mtimes come from the directory entries that were already listed, stat() is cached on each entry
+        if os.stat(_ASSET_CACHE_PATH).st_mtime >= max(_asset_entry(name).stat().st_mtime for name in _CACHED_ASSETS):
+            with open(_ASSET_CACHE_PATH, "rb") as f:
+                cache = pickle.load(f)
+            if cache.get("version") == _ASSET_CACHE_VERSION:
+                return cache["assets"]
+    except (OSError, EOFError, AttributeError, TypeError, pickle.UnpicklingError):
+        pass # Missing, unreadable or foreign cache, rebuild it
+
+    assets = {name: _parse_json(name) for name in _CACHED_ASSETS}
+    for name in ("constructors_per_season.json", "drivers_per_season.json"):
+        assets[name] = _dedupe_per_season(assets[name])
+    try:
+        os.makedirs(_ASSET_CACHE_DIR, exist_ok=True)
+        # Write to a temporary file and rename it, so concurrent processes never read a partially written cache
+        with tempfile.NamedTemporaryFile("wb", dir=_ASSET_CACHE_DIR, delete=False) as f:
+            pickle.dump({"version": _ASSET_CACHE_VERSION, "assets": assets}, f, protocol=5)
+        os.chmod(f.name, 0o644) # Temporary files are created 0600, other users (e.g. the app user after an image build) must read it
+        os.replace(f.name, _ASSET_CACHE_PATH)
+    except OSError:
+        pass # Without a writable cache dir the JSON is simply parsed on every start
+    return assets
+
+@functools.lru_cache(maxsize=None)
+def _load(name: str):
+    """Parse a JSON asset, once per file name"""
+    if name in _CACHED_ASSETS:
+        return _asset_cache()[name]
+    return _parse_json(name)
 
 # Architecture image
-IMAGE_BASE64: str = json.load(open("assets/image_base64.json"))['image_base64']
+IMAGE_BASE64: str
 
 # Variables
 CURRENT_YEAR = datetime.datetime.now().year
 
-AVAILABLE_SESSION_TYPES = [
-    "fp1", "fp2", "fp3", "q", "s", "ss", "sq", "r",
-    "practice 1", "practice 2", "practice 3", "sprint",
-    "sprint qualifying", "qualifying", "race"
-    ]
+# Accepted (lowercase) session type -> the session name it is normalized to
+SESSION_TYPE_ALIASES = {
+    "fp1": "practice 1", "fp2": "practice 2", "fp3": "practice 3", "q": "qualifying",
+    "s": "sprint", "ss": "ss", "sq": "sprint qualifying", "r": "race",
+    "practice 1": "practice 1", "practice 2": "practice 2", "practice 3": "practice 3", "sprint": "sprint",
+    "sprint qualifying": "sprint qualifying", "qualifying": "qualifying", "race": "race"
+    }
 
-DROPDOWN_SESSION_TYPES = [
+# For membership tests, iterate SESSION_TYPE_ALIASES when the order matters
+AVAILABLE_SESSION_TYPES: frozenset[str] = frozenset(SESSION_TYPE_ALIASES)
+
+DROPDOWN_SESSION_TYPES: tuple[str, ...] = (
     "practice 1", "practice 2", "practice 3", "sprint",
     "sprint qualifying", "qualifying", "race"
-    ]
+    )
+
+# The asset constants below are loaded on first access (see __getattr__ at the bottom of the file)
 
 # Load in driver names
-DRIVER_NAMES: list[str] = json.load(open("assets/driver_names.json"))["drivers"]
+DRIVER_NAMES: list[str]
 
 # Load in constructor team names
-CONSTRUCTOR_NAMES: list[str] = json.load(open("assets/constructors.json"))["constructors"]
+CONSTRUCTOR_NAMES: list[str]
 
 # Load in driver details
-DRIVER_DETAILS: dict[str, dict[str, str]] = json.load(open("assets/driver_details.json"))
+DRIVER_DETAILS: dict[str, dict[str, str]]
 
 # Load in constructor details
-CONSTRUCTOR_DETAILS: dict[str, dict[str, str]] = json.load(open("assets/constructor_details.json"))
+CONSTRUCTOR_DETAILS: dict[str, dict[str, str]]
+
+class DriverTable(NamedTuple):
+    """Driver details stored column-wise, the details of names[i] are at index i of every column"""
+    names: list[str]
+    birth_dates: list[str]
+    numbers: list[int]
+    teams: list[str]
+    nationalities: list[str]
+    summaries: list[str]
+    name_to_idx: dict[str, int]
+
+class ConstructorTable(NamedTuple):
+    """Constructor details stored column-wise, the details of names[i] are at index i of every column"""
+    names: list[str]
+    team_names: list[str]
+    chassis: list[str]
+    power_units: list[str]
+    bases: list[str]
+    team_principals: list[str]
+    drivers: list[list[str]]
+    name_to_idx: dict[str, int]
+
+# Column-wise driver and constructor details
+DRIVER_TABLE: DriverTable
+CONSTRUCTOR_TABLE: ConstructorTable
 
 # Load in constructor per season
-CONSTRUCTORS_PER_SEASON: dict[int, list[str]] = json.load(open("assets/constructors_per_season.json"))
+CONSTRUCTORS_PER_SEASON: Mapping[int, list[str]]
 
 # Load in driver per season
-DRIVERS_PER_SEASON: dict[int, list[str]] = json.load(open("assets/drivers_per_season.json"))
+DRIVERS_PER_SEASON: Mapping[int, list[str]]
 
 OPENF1_TOOL_DESCRIPTION = """
 ## OpenF1 Tools - API Endpoints.
@@ -49,10 +202,14 @@ The implemented functions make it possible to:
 - Get api string for a specific endpoint - `get_api_endpoint(endpoint)`
 - Get details about a specific endpoint - `get_endpoint_info(endpoint)`
 - Get information about a specific filter - `get_filter_info(filter_name)`
+- Get details about all endpoints at once - `get_all_endpoint_info()`
+- Get information about all filters at once - `get_all_filter_info()`
 - Get a filter string for a specific filter - `get_filter_string(filter_name, filter_value, operator)`
 - Apply filters to an API string - `apply_filters(api_string, *filters)`
 - Send a request to the OpenF1 API - `send_request(api_string)`
 
+Filter strings from `get_filter_string` have no trailing `&` (filter values are URL-encoded). Pass them to `apply_filters`, which also accepts several comma-separated filters in one string, or join them with `&` yourself.
+
 The inputs are strings while the output is a JSON object. The examples are listed in an order that would be expected to be used in a real-life scenario. Some example API strings are listed below in the final tool `send_request(api_string)`.
 
 """
@@ -82,171 +239,85 @@ Retrieve data about pit stops with session_key 9158 where the pit duration was l
 
 
 
-MARKDOWN_INTRODUCTION = f"""
-# 🏁 Formula 1 MCP server 🏎️
-
-Welcome to the Formula 1 MCP server, your one-stop destination for Formula 1 data retrieval and race real-time race strategy analysis.
-<br>
-This application leverages the FastF1 library and OpenF1 API to provide detailed insights into Formula 1 races, drivers, and teams.
-
-## Video Demonstration & Submissions
-
-### Short demo (Claude Desktop)
-Minimalistic demo of the MCP server using Claude Desktop.
-<!-- <iframe src="https://www.loom.com/embed/4e0a5dbf7b8e4c428a7e2a8a8a8edc3b" frameborder="0" webkitallowfullscreen mozallowfullscreen allowfullscreen style="position: absolute; top: 0; left: 0; width: 100%; height: 100%;"></iframe> -->
-
-### Longer demo and yap sesh (Gradio UI + mcp_client.py + Claude Desktop)
-More in-depth demo of interacting with the MCP server using Gradio UI, mcp_client.py and Claude Desktop.
-<!-- <iframe src="https://www.loom.com/embed/4e0a5dbf7b8e4c428a7e2a8a8a8edc3b" frameborder="0" webkitallowfullscreen mozallowfullscreen allowfullscreen style="position: absolute; top: 0; left: 0; width: 100%; height: 100%;"></iframe> -->
-
-## Architecture (Created with Excalidraw and icons from Lobehub)
-
-<img src="data:image/png;base64,{IMAGE_BASE64}" width="800" />
-
-
-## Available Tools in Gradio UI
-
-### Championship Standings
-- **Driver Standings**: Retrieve live or past driver championship standings for a specific driver
-- **Constructor Standings**: Retrieve live or past constructor championship standings for a specific constructor
-
-### Race Information
-- **Event Info**: Get detailed information about a specific Grand Prix event
-- **Season Calendar**: View the complete race calendar for any season
-- **Session Results**: Access race, qualifying, and sprint session results
-
-### Driver & Team Data
-- **Driver Info**: Retrieve detailed driver information from the 2025 Formula 1 season
-- **Constructor Info**: Retrieve detailed constructor information from the 2025 Formula 1 season
-- **Track Visualizations**: Explore interactive track maps with speed, gear, and corner visualizations
-
-### OpenF1 Tools
-- **OpenF1 Tools**: Access the OpenF1 API directly within the MCP server, allowing a LLM to interact with the API using natural language.
-
-## Usage
-
-There are different ways to interact with the MCP server:
-
-1) (recommended) Add the MCP server to your `mcp.json` file. This is the most user-friendly way to interact with the MCP server. See the section below for the MCP config file.
-
-2) (Good for demo) One can also use the Gradio interface directly to interact with the MCP server's tools. Note, however, the UI for the OpenF1 tools is purely limted to strings and JSON. 
-
-3) (Advanced) One can establish an MCP client by running `mcp_client.py`. This client is connected to the MCP server hosted on HuggingFace spaces.
-""" + """
-
-## MCP json configuration file
-
-For MCP clients that support SSE transport (For Claude desktop see below), the following configuration can be used in your `mcp.json` file (or its equivalent):
-
-```json
-{
-"mcpServers": {
-    "gradio": {
-    "url": "https://agents-mcp-hackathon-f1-mcp-server.hf.space/gradio_api/mcp/sse"
-    }
-}
-}
-```
-
-For Claude Desktop, the following configuration can instead be used, but make sure you have Node.js installed:
-
-```json
-{
-"mcpServers": {
-    "gradio": {
-    "command": "npx",
-    "args": [
-        "mcp-remote",
-        "https://agents-mcp-hackathon-f1-mcp-server.hf.space/gradio_api/mcp/sse",
-        "--transport",
-        "sse-only"
-    ]
-    }
+# The introductions live in assets/intro.*.tmpl and only reference the architecture image through {IMAGE_SRC},
+# the multi-MB data URI is spliced in by get_*_introduction() the first time a page needs it
+MARKDOWN_INTRODUCTION: str
+HTML_INTRODUCTION: str
+
+@functools.lru_cache(maxsize=1)
+def _image_src() -> str:
+    return "data:image/png;base64," + _lazy_constants["IMAGE_BASE64"]()
+
+@functools.lru_cache(maxsize=1)
+def get_markdown_introduction() -> str:
+    """Markdown introduction with the architecture image embedded, built once"""
+    with open(os.path.join(_ASSETS_DIR, "intro.md.tmpl"), encoding="utf-8") as f:
+        return f.read().replace("{IMAGE_SRC}", _image_src())
+
+@functools.lru_cache(maxsize=1)
+def get_html_introduction() -> str:
+    """HTML introduction with the architecture image embedded, built once"""
+    with open(os.path.join(_ASSETS_DIR, "intro.html.tmpl"), encoding="utf-8") as f:
+        return f.read().replace("{IMAGE_SRC}", _image_src())
+
+
+def _driver_table() -> DriverTable:
+    details = _load("driver_details.json")
+    rows = details.values()
+    return DriverTable(
+        names=_interned(details),
+        birth_dates=[d["birth_date"] for d in rows],
+        numbers=[d["number"] for d in rows],
+        teams=_interned(d["team"] for d in rows),
+        nationalities=_interned(d["nationality"] for d in rows),
+        summaries=[d["summary"] for d in rows],
+        name_to_idx={name: i for i, name in enumerate(details)},
+    )
+
+def _constructor_table() -> ConstructorTable:
+    details = _load("constructor_details.json")
+    rows = details.values()
+    return ConstructorTable(
+        names=_interned(details),
+        team_names=[d["team_name"] for d in rows],
+        chassis=[d["chassis"] for d in rows],
+        power_units=_interned(d["power_unit"] for d in rows),
+        bases=[d["base"] for d in rows],
+        team_principals=[d["team_principal"] for d in rows],
+        drivers=[_interned(d["drivers"]) for d in rows],
+        name_to_idx={name: i for i, name in enumerate(details)},
+    )
+
+
+# Name -> loader of every constant that is only built when first accessed
+_lazy_constants = {
+    "IMAGE_BASE64": lambda: _load("image_base64.json")["image_base64"],
+    "DRIVER_NAMES": lambda: _interned(_load("driver_names.json")["drivers"]),
+    "CONSTRUCTOR_NAMES": lambda: _interned(_load("constructors.json")["constructors"]),
+    "DRIVER_DETAILS": lambda: _load("driver_details.json"),
+    "CONSTRUCTOR_DETAILS": lambda: _load("constructor_details.json"),
+    "DRIVER_TABLE": _driver_table,
+    "CONSTRUCTOR_TABLE": _constructor_table,
+    # Read-only views, shared by every caller (the pickle cache stores the plain dicts)
+    "CONSTRUCTORS_PER_SEASON": lambda: MappingProxyType(_per_season(_load("constructors_per_season.json"))),
+    "DRIVERS_PER_SEASON": lambda: MappingProxyType(_per_season(_load("drivers_per_season.json"))),
+    "MARKDOWN_INTRODUCTION": get_markdown_introduction,
+    "HTML_INTRODUCTION": get_html_introduction,
 }
-}
-```
-"""
-
-
-HTML_INTRODUCTION = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Formula 1 MCP Server</title>
-</head>
-<body>
-    <h1>Formula 1 MCP Server</h1>
-    <p>Welcome to the Formula 1 MCP server, your one-stop destination for Formula 1 data retrieval and race real-time race strategy analysis.</p>
-    <p>This application leverages the FastF1 library and OpenF1 API to provide detailed insights into Formula 1 races, drivers, and teams.</p>
-
-    <h2>Quick demo (Claude Desktop)</h2>
-    <p>Quick demo of the MCP server using Claude Desktop.</p>
-    <iframe width="640" height="399" src="https://www.loom.com/embed/4ef9cf2e691143db8e5d807a1aef9672?sid=2acf26b1-49a0-4157-ac6b-3fdf08be8ea2" frameborder="0" webkitallowfullscreen mozallowfullscreen allowfullscreen></iframe>
-
-    <h2>Architecture (Created with Excalidraw and icons from Lobehub)</h2>
-    <img src="data:image/png;base64,{IMAGE_BASE64}" width="640" />
-
-    <h2>Available Tools in Gradio UI</h2>
-    <h3>Championship Standings</h3>
-    <ul>
-        <li>Driver Standings: Retrieve live or past driver championship standings for a specific driver</li>
-        <li>Constructor Standings: Retrieve live or past constructor championship standings for a specific constructor</li>
-    </ul>
-
-    <h3>Race Information</h3>
-    <ul>
-        <li>Event Info: Get detailed information about a specific Grand Prix event</li>
-        <li>Season Calendar: View the complete race calendar for any season</li>
-        <li>Session Results: Access race, qualifying, and sprint session results</li>
-    </ul>
-
-    <h3>Driver & Team Data</h3>
-    <ul>
-        <li>Driver Info: Retrieve detailed driver information from the 2025 Formula 1 season</li>
-        <li>Constructor Info: Retrieve detailed constructor information from the 2025 Formula 1 season</li>
-        <li>Track Visualizations: Explore interactive track maps with speed, gear, and corner visualizations</li>
-    </ul>
-
-    <h3>OpenF1 Tools</h3>
-    <ul>
-        <li>OpenF1 Tools: Access the OpenF1 API directly within the MCP server, allowing a LLM to interact with the API using natural language.</li>
-    </ul>
-""" + """
-    <h2>Acknowledgements</h2>
-    <p>Many thanks to Hugging Face, especially to the Gradio team for setting up this exciting Hackaton. Thanks to the external providers for their models and API credits.</p>
-
-    <h2>MCP json configuration file</h2>
-    <p>For MCP clients that support SSE transport (For Claude desktop see below), the following configuration can be used in your <code>mcp.json</code> file (or its equivalent):</p>
-    <pre><code>
-{
-  "mcpServers": {
-    "gradio": {
-      "url": "https://agents-mcp-hackathon-f1-mcp-server.hf.space/gradio_api/mcp/sse"
-    }
-  }
-}
-    </code></pre>
-
-    <p>For Claude Desktop, the following configuration can instead be used, but make sure you have Node.js installed:</p>
-    <pre><code>
-{
-  "mcpServers": {
-    "gradio": {
-      "command": "npx",
-      "args": [
-        "mcp-remote",
-        "https://agents-mcp-hackathon-f1-mcp-server.hf.space/gradio_api/mcp/sse",
-        "--transport",
-        "sse-only"
-      ]
-    }
-  }
-}
-    </code></pre>
 
-    </body>
-    </html>
-
-"""
-    
-    
\ No newline at end of file
+def preload_constants() -> None:
+    """Build every lazy constant now.
+
+    Call this before a server forks worker processes, so the workers inherit the parsed assets
+    (copy-on-write) instead of each loading them on first use.
+    """
+    module = sys.modules[__name__]
+    for name in _lazy_constants:
+        getattr(module, name)
+
+def __getattr__(name: str):
+    """Build lazy constants on first access (PEP 562) and store them as regular module attributes"""
+    if name not in _lazy_constants:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = _lazy_constants[name]()
+    return value
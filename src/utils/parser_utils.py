@@ -1,18 +1,54 @@
+import pandas as pd
+
+from typing import Callable
 from fastf1.events import EventSchedule, Event
 
+from utils.cache_utils import TTLCache
+
+# Event fields left out of the event info (in addition to every "...Date" field)
+_SKIP_KEYS = frozenset({"F1ApiSupport"})
+
+# Formatted strings of recently parsed events/calendars. The TTL lets updates to the current season come through.
+_parsed = TTLCache(maxsize=16, ttl=600)
+
+def _memoized(key: tuple, build: Callable[[], str]) -> str:
+    """Return the cached string for key, building it on a miss (keys without a season year are never cached)"""
+    if key[1] is None:
+        return build()
+    parsed = _parsed.get(key)
+    if parsed is None:
+        parsed = build()
+        _parsed.set(key, parsed)
+    return parsed
+
 def skip_key(key: str) -> bool:
-    return True if (key == "F1ApiSupport" or key.endswith("Date")) else False
+    return key in _SKIP_KEYS or key.endswith("Date")
 
 def parse_event_info(event: Event) -> str:
-    return "Event info:\n"+"\n".join(f"{k}: {v}" for (k, v) in event.items() if not skip_key(k))
+    key = ("event", getattr(event, "year", None), event["RoundNumber"], event["EventName"])
+    # Same test as skip_key, inlined to avoid a function call per field
+    return _memoized(key, lambda: "Event info:\n"+"\n".join(f"{k}: {v}" for (k, v) in event.items() if k not in _SKIP_KEYS and not k.endswith("Date")))
+
+# Only these columns end up in the calendar, so they are all that is hashed and formatted
+_CALENDAR_COLUMNS = ["RoundNumber", "EventName", "Location", "Country", "Session1DateUtc", "Session5DateUtc"]
 
 def parse_season_calendar(schedule: EventSchedule) -> str:
+    calendar = schedule[_CALENDAR_COLUMNS]
+    # Fingerprint of the calendar content, so a rescheduled or renamed event is never served from the cache
+    fingerprint = hash(pd.util.hash_pandas_object(calendar, index=False).to_numpy().tobytes())
+    return _memoized(("calendar", getattr(schedule, "year", None), fingerprint), lambda: _format_season_calendar(calendar))
+
+def _format_season_calendar(calendar: pd.DataFrame) -> str:
 
-    events = []
-    for idx in range(len(schedule)):
-        e = schedule.iloc[idx]
-        data_interval = f"{e['Session1DateUtc'].date()} - {e['Session5DateUtc'].date()}"
-        event_string = f"Round {e['RoundNumber']} : {e['EventName']} - {e['Location']}, {e['Country']} ({data_interval})"
-        events.append(event_string)
+    # Dates are formatted column-wise, the rows are then zipped as plain values instead of building a Series per row.
+    # strftime turns missing dates (e.g. testing events have no Session5) into NaN, they are printed as NaT.
+    starts = calendar["Session1DateUtc"].dt.strftime("%Y-%m-%d").fillna("NaT").to_numpy()
+    ends = calendar["Session5DateUtc"].dt.strftime("%Y-%m-%d").fillna("NaT").to_numpy()
+    events = [
+        f"Round {round_number} : {event_name} - {location}, {country} ({start} - {end})"
+        for round_number, event_name, location, country, start, end in zip(
+            calendar["RoundNumber"].to_numpy(), calendar["EventName"].to_numpy(), calendar["Location"].to_numpy(),
+            calendar["Country"].to_numpy(), starts, ends)
+    ]
 
     return "Season calendar:\n"+"\n".join(events)
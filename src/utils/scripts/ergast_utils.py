@@ -0,0 +1,59 @@
+import time
+import asyncio
+import httpx
+import orjson
+
+from collections import deque
+
+# Ergast's API has moved to the Jolpica mirror (the same backend fastf1 uses)
+ERGAST_URL = "https://api.jolpi.ca/ergast/f1"
+YEARS = range(2025, 1950, -1)
+MAX_CONCURRENT_REQUESTS = 4
+MAX_REQUESTS_PER_SECOND = 4 # Ergast's burst limit
+
+
+class RateLimiter:
+    """Allow at most max_requests starts per period seconds, only sleeping once that budget is used up"""
+
+    def __init__(self, max_requests: int, period: float = 1.0):
+        self.max_requests = max_requests
+        self.period = period
+        self._request_times = deque(maxlen=max_requests) # Start times of the most recent requests
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        async with self._lock:
+            if len(self._request_times) == self.max_requests:
+                wait = self.period - (time.monotonic() - self._request_times[0])
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            self._request_times.append(time.monotonic())
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+async def _fetch_standings(client: httpx.AsyncClient, semaphore: asyncio.Semaphore, limiter: RateLimiter, year: int, kind: str) -> list[dict]:
+    async with semaphore, limiter:
+        response = await client.get(f"/{year}/{kind}Standings.json", params={"limit": 100})
+    response.raise_for_status()
+    standings_lists = orjson.loads(response.content)["MRData"]["StandingsTable"]["StandingsLists"]
+    return standings_lists[0][f"{kind.capitalize()}Standings"] if standings_lists else []
+
+
+def fetch_all_standings(kind: str) -> dict[int, list[dict]]:
+    """Fetch the final "driver" or "constructor" standings of every season in YEARS, a few requests at a time and within the rate limit"""
+
+    async def fetch_all():
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        limiter = RateLimiter(MAX_REQUESTS_PER_SECOND)
+        async with httpx.AsyncClient(base_url=ERGAST_URL, timeout=30) as client:
+            standings = await asyncio.gather(*(_fetch_standings(client, semaphore, limiter, year, kind) for year in YEARS))
+        return dict(zip(YEARS, standings))
+
+    return asyncio.run(fetch_all())
+
+
+def write_json(path: str, data: dict) -> None:
+    with open(path, "wb") as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)) # JSON keys must be strings, seasons are ints
@@ -3,88 +3,165 @@ import matplotlib as mpl
 
 from PIL import Image
 from io import BytesIO
+from queue import Empty, LifoQueue
 from typing import Union
-from fastf1.core import Session
+from functools import lru_cache
+from contextlib import contextmanager
+from fastf1.core import Lap, Session, Telemetry
 from matplotlib import pyplot as plt
+from matplotlib.figure import Figure
 from matplotlib.collections import LineCollection
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 
 # Custom types
 gp = Union[str, int]
 session_type = Union[str, int, None]
 
 
-def rotate(xy, *, angle):
+# Colormaps are looked up (and resampled) once instead of on every plot
+_VIRIDIS = mpl.colormaps['viridis']
+_VIRIDIS_8 = _VIRIDIS.resampled(8)  # One color per gear
+
+# Idle (figure, track axes, colorbar axes) triples for the speed/gear visualizations.
+# Figures are created without pyplot so they are never registered with (or leaked by) its figure manager.
+_FIGURE_POOL = LifoQueue()
+
+
+def _new_track_figure() -> tuple[Figure, plt.Axes, plt.Axes]:
+    fig = Figure(figsize=(12, 6.75))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    cbaxes = fig.add_axes([0.25, 0.05, 0.5, 0.05])
+    fig.subplots_adjust(left=0.1, right=0.9, top=0.9, bottom=0.12)
+    return fig, ax, cbaxes
+
+
+@contextmanager
+def _pooled_track_figure():
+    """Borrow a cleared figure from the pool, creating one if all are in use"""
+    try:
+        fig, ax, cbaxes = _FIGURE_POOL.get_nowait()
+    except Empty:
+        fig, ax, cbaxes = _new_track_figure()
+    try:
+        yield fig, ax, cbaxes
+    finally:
+        # clear() keeps the aspect (set by the gear plot) and the axes locator the colorbar installs,
+        # so reset those too or the next plot on this figure inherits the previous plot's layout
+        ax.clear()
+        ax.set_aspect('auto', adjustable='box')
+        cbaxes.clear()
+        cbaxes.set_axes_locator(None)
+        cbaxes.set_position(cbaxes.get_position(original=True), which='active')
+        cbaxes.set_in_layout(True)  # set_position() takes it out of the tight bbox
+        _FIGURE_POOL.put((fig, ax, cbaxes))
+
+
+def figure_to_image(fig: Figure, dpi: int = 150) -> Image.Image:
+    """Render a figure cropped to its tight bounding box straight into a PIL image.
+
+    Equivalent to savefig(..., bbox_inches='tight') followed by Image.open, but the
+    pixels are written as raw RGBA so there is no PNG encode/decode in between.
+    """
+    fig.set_dpi(dpi)
+    bbox = fig.get_tightbbox().padded(mpl.rcParams['savefig.pad_inches'])
+    buf = BytesIO()
+    fig.savefig(buf, format='rgba', dpi=dpi, bbox_inches=bbox)
+    size = (int(bbox.width * dpi), int(bbox.height * dpi))
+    return Image.frombuffer('RGBA', size, buf.getbuffer(), 'raw', 'RGBA', 0, 1)
+
+
+@lru_cache(maxsize=32)
+def _rotation_matrix(angle: float) -> np.ndarray:
     rot_mat = np.array([[np.cos(angle), np.sin(angle)],
                         [-np.sin(angle), np.cos(angle)]])
-    return np.matmul(xy, rot_mat)
+    rot_mat.flags.writeable = False  # Shared between callers
+    return rot_mat
 
 
-def create_track_speed_visualization(session: Session) -> Image:
+def rotate(xy, *, angle):
+    """Rotate points of shape [..., 2] by a scalar angle, or points of shape [n, 2] by n angles"""
+    if np.ndim(angle) == 0:
+        return np.matmul(xy, _rotation_matrix(float(angle)))
+    cos, sin = np.cos(angle), np.sin(angle)
+    rot_mats = np.stack((np.stack((cos, sin), axis=-1),
+                         np.stack((-sin, cos), axis=-1)), axis=-2)  # [n, 2, 2]
+    return np.einsum('ni,nij->nj', xy, rot_mats)
+
+
+def track_segments(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Line segments of shape [n-1, 2, 2] joining consecutive track points"""
+    start = np.stack((x[:-1], y[:-1]), axis=1)
+    end = np.stack((x[1:], y[1:]), axis=1)
+    return np.stack((start, end), axis=1)
+
+
+def fastest_lap_telemetry(session: Session) -> tuple[Lap, Telemetry]:
+    """Fastest lap of a loaded session and its telemetry, computed once per loaded session.
+
+    The result is stored on the session itself, so it is released together with the session.
+    """
+    cached = getattr(session, "_fastest_lap_telemetry", None)
+    if cached is None or cached[0] is not session.laps:
+        lap = session.laps.pick_fastest()
+        # lap.telemetry rebuilds the merged frame on every access, so do it once
+        cached = (session.laps, lap, lap.get_telemetry())
+        session._fastest_lap_telemetry = cached
+    return cached[1], cached[2]
+
+
+def create_track_speed_visualization(session: Session, lap: Lap = None, tel: Telemetry = None) -> Image:
 
     weekend = session.event
-    lap = session.laps.pick_fastest()
+    if lap is None or tel is None:
+        lap, tel = fastest_lap_telemetry(session)
 
     # Get telemetry data
-    x = lap.telemetry['X']              # values for x-axis
-    y = lap.telemetry['Y']              # values for y-axis
-    color = lap.telemetry['Speed']      # value to base color gradient on
-
+    # float32 is plenty for plotting and halves the size of the segment arrays
+    x = tel['X'].to_numpy(dtype=np.float32)             # values for x-axis
+    y = tel['Y'].to_numpy(dtype=np.float32)             # values for y-axis
+    color = tel['Speed'].to_numpy(dtype=np.float32)     # value to base color gradient on
 
-    points = np.array([x, y]).T.reshape(-1, 1, 2)
-    segments = np.concatenate([points[:-1], points[1:]], axis=1)
+    segments = track_segments(x, y)
 
     # We create a plot with title and adjust some setting to make it look good.
-    fig, ax = plt.subplots(sharex=True, sharey=True, figsize=(12, 6.75))
-    fig.suptitle(f'[Speed] {weekend["EventName"]} - {lap["Driver"]} #{lap["DriverNumber"]} ', size=24, y=0.97)
+    with _pooled_track_figure() as (fig, ax, cbaxes):
+        fig.suptitle(f'[Speed] {weekend["EventName"]} - {lap["Driver"]} #{lap["DriverNumber"]} ', size=24, y=0.97)
 
-    # Adjust margins and turn of axis
-    plt.subplots_adjust(left=0.1, right=0.9, top=0.9, bottom=0.12)
-    ax.axis('off')
+        # Turn off axis (margins are set once when the figure is created)
+        ax.axis('off')
 
-    # After this, we plot the data itself.
-    # Create background track line
-    ax.plot(lap.telemetry['X'], lap.telemetry['Y'],
-            color='black', linestyle='-', linewidth=16, zorder=0)
+        # After this, we plot the data itself.
+        # Create background track line
+        ax.plot(x, y,
+                color='black', linestyle='-', linewidth=16, zorder=0)
 
-    # Create a continuous norm to map from data points to colors
-    norm = plt.Normalize(color.min(), color.max())
-    lc = LineCollection(segments, cmap=mpl.colormaps['viridis'], norm=norm,
-                        linestyle='-', linewidth=5)
+        # Create a continuous norm to map from data points to colors
+        norm = plt.Normalize(color.min(), color.max())
+        lc = LineCollection(segments, cmap=_VIRIDIS, norm=norm,
+                            linestyle='-', linewidth=5)
 
-    # Set the values used for colormapping
-    lc.set_array(color)
+        # Set the values used for colormapping
+        lc.set_array(color)
 
-    # Merge all line segments together
-    line = ax.add_collection(lc)
+        # Merge all line segments together
+        line = ax.add_collection(lc)
 
-    # Finally, we create a color bar as a legend.
-    cbaxes = fig.add_axes([0.25, 0.05, 0.5, 0.05])
-    normlegend = mpl.colors.Normalize(vmin=color.min(), vmax=color.max())
-    legend = mpl.colorbar.ColorbarBase(cbaxes, norm=normlegend, cmap=mpl.colormaps['viridis'],
-                                    orientation="horizontal")
-    legend.set_label("Speed [km/h]")
+        # Finally, we create a color bar as a legend.
+        normlegend = mpl.colors.Normalize(vmin=color.min(), vmax=color.max())
+        legend = mpl.colorbar.ColorbarBase(cbaxes, norm=normlegend, cmap=_VIRIDIS,
+                                        orientation="horizontal")
+        legend.set_label("Speed [km/h]")
 
-    # Create a PIL image from the plot
-    fig = plt.gcf()
-    
-    # Save the figure to a BytesIO buffer and convert to bytes
-    buf = BytesIO()
-    fig.savefig(buf, format='png', dpi=150, bbox_inches='tight')
-    buf.seek(0)
-    
-    # Create PIL image from buffer bytes and close the figure
-    img_data = buf.getvalue()
-    plt.close(fig)
-    buf.close()
-    
-    # Create new image from the raw bytes
-    img = Image.open(BytesIO(img_data))
+        # Create a PIL image from the plot
+        img = figure_to_image(fig)
     return img
 
 
-def create_track_corners_visualization(session: Session) -> Image:
+def create_track_corners_visualization(session: Session, lap: Lap = None) -> Image:
     
-    lap = session.laps.pick_fastest()
+    if lap is None:
+        lap, _ = fastest_lap_telemetry(session)
     pos = lap.get_pos_data()
 
     circuit_info = session.get_circuit_info()
@@ -101,36 +178,27 @@ def create_track_corners_visualization(session: Session) -> Image:
     rotated_track = rotate(track, angle=track_angle)
     plt.plot(rotated_track[:, 0], rotated_track[:, 1])
 
-    offset_vector = [500, 0]  # offset length is chosen arbitrarily to 'look good'
+    offset_length = 500  # offset length is chosen arbitrarily to 'look good'
 
-    # Iterate over all corners.
-    for _, corner in circuit_info.corners.iterrows():
-        # Create a string from corner number and letter
-        txt = f"{corner['Number']}{corner['Letter']}"
+    # Corner data as arrays
+    corners = circuit_info.corners
+    corner_xy = corners[['X', 'Y']].to_numpy()
+    labels = corners['Number'].astype(str) + corners['Letter'].astype(str)
 
-        # Convert the angle from degrees to radian.
-        offset_angle = corner['Angle'] / 180 * np.pi
+    # Rotate the offset vector of every corner so that it points sideways from the track.
+    offset_angles = corners['Angle'].to_numpy() / 180 * np.pi
+    offsets = rotate(np.tile([offset_length, 0.0], (len(corners), 1)), angle=offset_angles)
 
-        # Rotate the offset vector so that it points sideways from the track.
-        offset_x, offset_y = rotate(offset_vector, angle=offset_angle)
+    # Rotate the text positions and the corner centers equivalently to the rest of the track map
+    text_xy = rotate(corner_xy + offsets, angle=track_angle)
+    track_xy = rotate(corner_xy, angle=track_angle)
 
-        # Add the offset to the position of the corner
-        text_x = corner['X'] + offset_x
-        text_y = corner['Y'] + offset_y
+    # Draw a line from the track to each circle, and the circles next to the track.
+    plt.gca().add_collection(LineCollection(np.stack((track_xy, text_xy), axis=1), colors='grey'))
+    plt.scatter(text_xy[:, 0], text_xy[:, 1], color='grey', s=140)
 
-        # Rotate the text position equivalently to the rest of the track map
-        text_x, text_y = rotate([text_x, text_y], angle=track_angle)
-
-        # Rotate the center of the corner equivalently to the rest of the track map
-        track_x, track_y = rotate([corner['X'], corner['Y']], angle=track_angle)
-
-        # Draw a circle next to the track.
-        plt.scatter(text_x, text_y, color='grey', s=140)
-
-        # Draw a line from the track to this circle.
-        plt.plot([track_x, text_x], [track_y, text_y], color='grey')
-
-        # Finally, print the corner number inside the circle.
+    # Finally, print the corner numbers inside the circles.
+    for (text_x, text_y), txt in zip(text_xy, labels):
         plt.text(text_x, text_y, txt,
                 va='center_baseline', ha='center', size='small', color='white')
 
@@ -140,77 +208,66 @@ def create_track_corners_visualization(session: Session) -> Image:
     plt.yticks([])
     plt.axis('equal')
     
-    # Create a PIL image from the plot
+    # Create a PIL image from the plot and close the figure
     fig = plt.gcf()
-    
-    # Save the figure to a BytesIO buffer and convert to bytes
-    buf = BytesIO()
-    fig.savefig(buf, format='png', dpi=150, bbox_inches='tight')
-    buf.seek(0)
-    
-    # Create PIL image from buffer bytes and close the figure
-    img_data = buf.getvalue()
+    img = figure_to_image(fig)
     plt.close(fig)
-    buf.close()
-    
-    # Create new image from the raw bytes
-    img = Image.open(BytesIO(img_data))
     return img
 
 
-def create_track_gear_visualization(session: Session) -> Image:
+def create_track_gear_visualization(session: Session, lap: Lap = None, tel: Telemetry = None) -> Image:
     weekend = session.event
-    lap = session.laps.pick_fastest()
-    tel = lap.get_telemetry()
+    if lap is None or tel is None:
+        lap, tel = fastest_lap_telemetry(session)
 
-    x = np.array(tel['X'].values)
-    y = np.array(tel['Y'].values)
+    x = tel['X'].to_numpy(dtype=np.float32)
+    y = tel['Y'].to_numpy(dtype=np.float32)
 
-    points = np.array([x, y]).T.reshape(-1, 1, 2)
-    segments = np.concatenate([points[:-1], points[1:]], axis=1)
-    gear = tel['nGear'].to_numpy().astype(float)
+    segments = track_segments(x, y)
+    gear = tel['nGear'].to_numpy(dtype=np.float32)  # Float, since the colormap norm needs floats
 
-    fig, ax = plt.subplots(sharex=True, sharey=True, figsize=(12, 6.75))
-    fig.suptitle(f'[Gear] {weekend["EventName"]} - {lap["Driver"]} #{lap["DriverNumber"]}', size=24, x=0.5, ha='center', y=0.97)
+    with _pooled_track_figure() as (fig, ax, cbaxes):
+        fig.suptitle(f'[Gear] {weekend["EventName"]} - {lap["Driver"]} #{lap["DriverNumber"]}', size=24, x=0.5, ha='center', y=0.97)
 
-    plt.subplots_adjust(left=0.1, right=0.9, top=0.9, bottom=0.12)
-    ax.axis('off')
+        ax.axis('off')
 
-    # Plot a background track line (black, thick) for context
-    ax.plot(lap.telemetry['X'], lap.telemetry['Y'],
-            color='black', linestyle='-', linewidth=16, zorder=0)
+        # Plot a background track line (black, thick) for context
+        ax.plot(x, y,
+                color='black', linestyle='-', linewidth=16, zorder=0)
 
-    # Draw the colored segments
-    lc_comp = LineCollection(segments, norm=plt.Normalize(gear.min(), gear.max()), cmap=plt.cm.get_cmap('viridis', 8))
-    lc_comp.set_array(gear)
-    lc_comp.set_linewidth(4)
-    ax.add_collection(lc_comp)
+        # Draw the colored segments
+        lc_comp = LineCollection(segments, norm=plt.Normalize(gear.min(), gear.max()), cmap=_VIRIDIS_8)
+        lc_comp.set_array(gear)
+        lc_comp.set_linewidth(4)
+        ax.add_collection(lc_comp)
 
-    # Set axis limits to the data range with padding to avoid clipping
-    x_pad = (x.max() - x.min()) * 0.03
-    y_pad = (y.max() - y.min()) * 0.03
-    ax.set_xlim(x.min() - x_pad, x.max() + x_pad)
-    ax.set_ylim(y.min() - y_pad, y.max() + y_pad)
+        # Set axis limits to the data range with padding to avoid clipping
+        x_pad = (x.max() - x.min()) * 0.03
+        y_pad = (y.max() - y.min()) * 0.03
+        ax.set_xlim(x.min() - x_pad, x.max() + x_pad)
+        ax.set_ylim(y.min() - y_pad, y.max() + y_pad)
 
-    # Set axis equal for correct aspect
-    ax.set_aspect('equal', adjustable='datalim')
+        # Set axis equal for correct aspect
+        ax.set_aspect('equal', adjustable='datalim')
 
-    # Add colorbar at the bottom
-    cbaxes = fig.add_axes([0.25, 0.05, 0.5, 0.05])
-    normlegend = plt.Normalize(1, 8)
-    legend = mpl.colorbar.ColorbarBase(cbaxes, norm=normlegend, cmap=plt.cm.get_cmap('viridis', 8),
-                                       orientation="horizontal")
-    legend.set_ticks(np.arange(1, 9))
-    legend.set_ticklabels(np.arange(1, 9))
-    legend.set_label("Gear")
-
-    # Create a PIL image from the plot
-    buf = BytesIO()
-    fig.savefig(buf, format='png', dpi=150, bbox_inches='tight')
-    buf.seek(0)
-    img_data = buf.getvalue()
-    plt.close(fig)
-    buf.close()
-    img = Image.open(BytesIO(img_data))
+        # Add colorbar at the bottom
+        normlegend = plt.Normalize(1, 8)
+        legend = mpl.colorbar.ColorbarBase(cbaxes, norm=normlegend, cmap=_VIRIDIS_8,
+                                           orientation="horizontal")
+        legend.set_ticks(np.arange(1, 9))
+        legend.set_ticklabels(np.arange(1, 9))
+        legend.set_label("Gear")
+
+        # Create a PIL image from the plot
+        img = figure_to_image(fig)
     return img
-    
\ No newline at end of file
+
+
+def create_all_visualizations(session: Session) -> dict[str, Image.Image]:
+    """Create the speed, corners and gear visualizations from a single telemetry fetch"""
+    lap, tel = fastest_lap_telemetry(session)
+    return {
+        "speed": create_track_speed_visualization(session, lap, tel),
+        "corners": create_track_corners_visualization(session, lap),
+        "gear": create_track_gear_visualization(session, lap, tel)
+    }
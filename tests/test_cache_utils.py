@@ -0,0 +1,105 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from utils.cache_utils import TTLCache, ttl_cache
+
+
+class TTLCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 1000.0
+        patcher = mock.patch("utils.cache_utils.time.monotonic", side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_entries_expire_after_their_ttl(self):
+        cache = TTLCache(ttl=10)
+        cache.set("default", 1)
+        cache.set("short", 2, ttl=1)
+        cache.set("long", 3, ttl=100)
+
+        self.now += 5
+        self.assertIsNone(cache.get("short"))
+        self.assertEqual(cache.get("default"), 1)
+
+        self.now += 10
+        self.assertEqual(cache.get("missing", "default"), "default")
+        self.assertIsNone(cache.get("default"))
+        self.assertEqual(cache.get("long"), 3)
+        self.assertEqual(len(cache), 1)
+
+    def test_entries_without_ttl_never_expire(self):
+        cache = TTLCache()
+        cache.set("key", "value")
+        self.now += 10**9
+        self.assertEqual(cache.get("key"), "value")
+
+    def test_least_recently_used_entry_is_evicted_by_count(self):
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now the least recently used
+        cache.set("c", 3)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_least_recently_used_entries_are_evicted_by_weight(self):
+        cache = TTLCache(maxweight=10, weigh=len)
+        cache.set("a", b"12345")
+        cache.set("b", b"1234")
+        cache.set("c", b"123")  # 12 > 10, so "a" goes
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), b"1234")
+        self.assertEqual(cache.get("c"), b"123")
+
+        cache.set("b", b"1")  # Replacing a value releases the old weight
+        cache.set("d", b"123456")
+        self.assertEqual(len(cache), 3)
+
+    def test_values_heavier_than_maxweight_are_not_stored(self):
+        cache = TTLCache(maxweight=10, weigh=len)
+        cache.set("small", b"123")
+        cache.set("huge", b"x" * 11)
+
+        self.assertIsNone(cache.get("huge"))
+        self.assertEqual(cache.get("small"), b"123")  # Nothing was evicted to make room
+
+    def test_clear_resets_entries_and_weight(self):
+        cache = TTLCache(maxweight=10, weigh=len)
+        cache.set("a", b"1234567890")
+        cache.clear()
+        cache.set("b", b"1234567890")
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get("b"), b"1234567890")
+
+
+class TTLCacheDecoratorTest(unittest.TestCase):
+
+    def test_results_are_memoized_per_arguments(self):
+        calls = []
+
+        @ttl_cache(maxsize=2)
+        def double(x):
+            calls.append(x)
+            return 2 * x
+
+        self.assertEqual(double(2), 4)
+        self.assertEqual(double(2), 4)
+        self.assertEqual(double(3), 6)
+        self.assertEqual(calls, [2, 3])
+
+        double.cache_clear()
+        double(2)
+        self.assertEqual(calls, [2, 3, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
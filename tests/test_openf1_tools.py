@@ -0,0 +1,52 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import openf1_tools
+
+API_STRING = "https://api.openf1.org/v1/laps?session_key=9161&driver_number=63"
+
+
+def _response(status_code: int, content: bytes = b"", headers: dict = None) -> mock.Mock:
+    response = mock.Mock(status_code=status_code, content=content, headers=headers or {})
+    response.raise_for_status.return_value = None
+    return response
+
+
+class SendRequestTest(unittest.TestCase):
+
+    def setUp(self):
+        openf1_tools.send_request.cache_clear()
+        self.addCleanup(openf1_tools.send_request.cache_clear)
+        patcher = mock.patch.object(openf1_tools._session, "get")
+        self.get = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_not_modified_response_reuses_the_stored_body(self):
+        self.get.side_effect = [
+            _response(200, b'[{"lap_number": 8}]', {"ETag": '"v1"'}),
+            _response(304),
+        ]
+        first = openf1_tools.send_request(API_STRING)
+
+        openf1_tools._response_cache.clear()  # Expire the response, the ETag entry is kept
+        second = openf1_tools.send_request(API_STRING)
+
+        self.assertEqual(second, [{"lap_number": 8}])
+        self.assertEqual(second, first)
+        self.assertEqual(self.get.call_args_list[1].kwargs["headers"], {"If-None-Match": '"v1"'})
+
+    def test_cached_responses_are_not_shared_between_callers(self):
+        self.get.return_value = _response(200, b'[{"lap_number": 8}]')
+        first = openf1_tools.send_request(API_STRING)
+        first[0]["lap_number"] = 99
+
+        self.assertEqual(openf1_tools.send_request(API_STRING), [{"lap_number": 8}])
+        self.assertEqual(self.get.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
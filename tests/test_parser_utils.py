@@ -0,0 +1,34 @@
+import sys
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from utils.parser_utils import parse_season_calendar
+
+
+class ParseSeasonCalendarTest(unittest.TestCase):
+
+    def test_missing_dates_are_printed_as_nat(self):
+        # Testing events have no Session5 date
+        schedule = pd.DataFrame({
+            "RoundNumber": [0, 1],
+            "EventName": ["Pre-Season Testing", "Bahrain Grand Prix"],
+            "Location": ["Sakhir", "Sakhir"],
+            "Country": ["Bahrain", "Bahrain"],
+            "Session1DateUtc": pd.to_datetime(["2024-02-21 07:00", "2024-02-29 11:30"]),
+            "Session5DateUtc": pd.to_datetime([None, "2024-03-02 15:00"]),
+        })
+
+        self.assertEqual(
+            parse_season_calendar(schedule),
+            "Season calendar:\n"
+            "Round 0 : Pre-Season Testing - Sakhir, Bahrain (2024-02-21 - NaT)\n"
+            "Round 1 : Bahrain Grand Prix - Sakhir, Bahrain (2024-02-29 - 2024-03-02)"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
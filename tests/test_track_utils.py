@@ -0,0 +1,72 @@
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from utils import track_utils
+
+
+class _Lap(dict):
+    """Minimal stand-in for a fastf1 Lap: item access plus get_telemetry()"""
+
+    def __init__(self, telemetry: pd.DataFrame, **items):
+        super().__init__(**items)
+        self._telemetry = telemetry
+
+    def get_telemetry(self) -> pd.DataFrame:
+        return self._telemetry.copy()
+
+
+def _fake_session() -> SimpleNamespace:
+    t = np.linspace(0, 2 * np.pi, 400)
+    telemetry = pd.DataFrame({
+        "X": 1000 * np.cos(t),
+        "Y": 600 * np.sin(t),
+        "Speed": 200 + 50 * np.sin(3 * t),
+        "nGear": (4 + 3 * np.sin(2 * t)).round().astype(int),
+    })
+    lap = _Lap(telemetry, Driver="VER", DriverNumber="1")
+    return SimpleNamespace(event={"EventName": "Test GP"}, laps=SimpleNamespace(pick_fastest=lambda: lap))
+
+
+class PooledTrackFigureTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = _fake_session()
+        self._empty_pool()
+
+    def tearDown(self):
+        self._empty_pool()
+
+    @staticmethod
+    def _empty_pool():
+        while not track_utils._FIGURE_POOL.empty():
+            track_utils._FIGURE_POOL.get_nowait()
+
+    def _render_fresh(self, create) -> np.ndarray:
+        self._empty_pool()
+        return np.asarray(create(self.session))
+
+    def _render_after(self, previous, create) -> np.ndarray:
+        self._empty_pool()
+        previous(self.session)  # Returns its figure to the pool, the next plot reuses it
+        return np.asarray(create(self.session))
+
+    def test_speed_after_gear_matches_fresh_figure(self):
+        fresh = self._render_fresh(track_utils.create_track_speed_visualization)
+        recycled = self._render_after(track_utils.create_track_gear_visualization, track_utils.create_track_speed_visualization)
+        np.testing.assert_array_equal(recycled, fresh)
+
+    def test_gear_after_speed_matches_fresh_figure(self):
+        fresh = self._render_fresh(track_utils.create_track_gear_visualization)
+        recycled = self._render_after(track_utils.create_track_speed_visualization, track_utils.create_track_gear_visualization)
+        np.testing.assert_array_equal(recycled, fresh)
+
+
+if __name__ == "__main__":
+    unittest.main()